@@ -18,6 +18,8 @@ PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_ENVIRONMENT = os.getenv("PINECONE_ENVIRONMENT", "us-east-1")
 PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "warehouse-ai-embeddings")
 USE_PINECONE = os.getenv("USE_PINECONE", "False").lower() == "true"  # Set to True to use Pinecone
+PINECONE_UPSERT_BATCH_SIZE = 100  # Vectors per upsert request (Pinecone's recommended limit)
+PINECONE_UPSERT_WORKERS = 16  # Concurrent upsert requests - CHANGE THIS if you hit rate limits
 
 # Storage Mode Configuration
 # "pinecone_only" - Store only in Pinecone (no local cache, cloud-only)
@@ -38,6 +40,11 @@ SIMILARITY_THRESHOLD = 0.35  # Minimum similarity score (0-1) - CHANGE THIS to a
 # Scores: 50-100% = Excellent, 30-50% = Good, 10-30% = Fair, 0-10% = Poor
 MAX_RESULTS = 5  # Maximum number of results - CHANGE THIS to limit total results shown
 
+# Local vector index (used when the optional faiss package is installed)
+FAISS_HNSW_MIN_VECTORS = 50000  # Switch from exact (flat) to approximate HNSW search at this many vendors
+FAISS_HNSW_M = 32  # HNSW graph neighbors per node (higher = more accurate, more memory)
+FAISS_HNSW_EF_SEARCH = 128  # HNSW search depth (higher = more accurate, slower)
+
 # Data Configuration
 # ==================
 # CHANGE THIS to switch between different data sources
@@ -492,6 +499,11 @@ SPECIALIZATION_KEYWORDS = {
 KEYWORD_REPETITION_COUNT = 10  # Boost keyword-specific matches (electronics, IT, etc.)
 # This makes vendors with matching specialization keywords score higher
 
+# ====================
+# EMBEDDING TEXT CACHE
+# ====================
+EMBEDDING_TEXT_CACHE_SIZE = 50000  # Prepared embedding texts kept in memory across re-index runs (0 = disable)
+
 
 # ====================
 # UI CONFIGURATION (Customizable Labels & Text)
@@ -3,6 +3,8 @@ Pinecone Vector Store Module
 Handles storage and retrieval of embeddings using Pinecone vector database
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pinecone import Pinecone, ServerlessSpec
 import numpy as np
 from typing import List, Dict, Any, Tuple
@@ -79,7 +81,6 @@ class PineconeVectorStore:
                 elif isinstance(value, list):
                     # Handle list of dicts (like notes_raw) - serialize as JSON string
                     if value and isinstance(value[0], dict):
-                        import json
                         filtered_meta[f"{key}_json"] = json.dumps(value)
                     # Include lists of simple types
                     elif all(isinstance(v, (str, int, float, bool)) for v in value):
@@ -92,11 +93,25 @@ class PineconeVectorStore:
                 "metadata": filtered_meta
             })
         
-        # Add database fingerprint as a special metadata-only vector
+        # Upsert in batches, several requests in flight at once (upserts are
+        # round-trip bound, and the HTTP calls release the GIL)
+        batch_size = config.PINECONE_UPSERT_BATCH_SIZE
+        batches = [vectors[i:i + batch_size] for i in range(0, len(vectors), batch_size)]
+        uploaded = 0
+        with ThreadPoolExecutor(max_workers=config.PINECONE_UPSERT_WORKERS) as executor:
+            futures = {executor.submit(self.index.upsert, vectors=batch): len(batch)
+                       for batch in batches}
+            for future in as_completed(futures):
+                future.result()  # Re-raise upload errors
+                uploaded += futures[future]
+                print(f"  Uploaded {uploaded}/{len(vectors)} vectors")
+        
+        # Add database fingerprint as a special metadata-only vector - only after every
+        # vendor batch succeeded, so a partial upload is never marked as up to date
         if db_fingerprint:
             # Create a small random vector (Pinecone requires non-zero values)
             fingerprint_vector = [0.001] * self.dimension
-            vectors.append({
+            self.index.upsert(vectors=[{
                 "id": "_db_fingerprint",
                 "values": fingerprint_vector,
                 "metadata": {
@@ -105,14 +120,7 @@ class PineconeVectorStore:
                     "vendor_count": len(metadata),
                     "timestamp": time.time()
                 }
-            })
-        
-        # Upsert in batches of 100
-        batch_size = 100
-        for i in range(0, len(vectors), batch_size):
-            batch = vectors[i:i + batch_size]
-            self.index.upsert(vectors=batch)
-            print(f"  Uploaded {min(i + batch_size, len(vectors))}/{len(vectors)} vectors")
+            }])
         
         print(f"✅ Successfully uploaded {len(embeddings)} embeddings to Pinecone")
     
@@ -4,16 +4,313 @@ Handles storage and similarity search of embeddings
 Supports both local storage (pickle) and Pinecone vector database
 """
 
+import hashlib
+import json
 import pickle
 import os
+import time
+from functools import lru_cache
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
-from sklearn.metrics.pairwise import cosine_similarity
+import xxhash
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import config
 
-# Import Pinecone store if enabled
-if config.USE_PINECONE:
-    from core.pinecone_store import PineconeVectorStore
+# Optional: SIMD cosine kernels (AVX2/AVX-512/NEON/SVE), detected at runtime
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# Optional: FAISS inner-product index (exact flat, or HNSW for large stores)
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Squared-norm tolerance for treating embeddings as already L2-normalized
+UNIT_NORM_TOLERANCE = 1e-4
+
+# SimSIMD capability flags that indicate a hardware SIMD kernel (not the serial fallback)
+SIMSIMD_SIMD_CAPABILITIES = ('haswell', 'skylake', 'ice', 'genoa', 'sapphire', 'turin',
+                             'neon', 'sve', 'sierra')
+
+# Shape of the random matrix both cosine kernels are timed on before SimSIMD is chosen
+COSINE_PROBE_SHAPE = (4096, 1536)
+
+# Byte alignment of the embedding matrix (one cache line / one AVX-512 register)
+EMBEDDING_ALIGNMENT = 64
+
+# Upper bound on cached decoded Pinecone JSON fields before the cache is reset
+PINECONE_META_CACHE_SIZE = 10000
+
+
+def _aligned_empty(shape: Tuple[int, ...], dtype=np.float32) -> np.ndarray:
+    """
+    Allocate an uninitialized C-contiguous array aligned to EMBEDDING_ALIGNMENT bytes
+    
+    NumPy's default allocator only guarantees 16-byte alignment, which forces SIMD
+    kernels into split loads. Over-allocate a byte buffer and slice at an aligned offset.
+    Rows stay aligned too as long as the dimension is a multiple of 16 (true for OpenAI models).
+    
+    Args:
+        shape: Array shape
+        dtype: Array dtype
+        
+    Returns:
+        Aligned, uninitialized array
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(nbytes + EMBEDDING_ALIGNMENT, dtype=np.uint8)
+    offset = (-buffer.ctypes.data) % EMBEDDING_ALIGNMENT
+    return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def _as_aligned(embeddings) -> np.ndarray:
+    """
+    Return embeddings as an aligned float32 matrix, copying only if needed
+    
+    Args:
+        embeddings: Embedding vectors (list of lists or numpy array)
+        
+    Returns:
+        C-contiguous float32 array aligned to EMBEDDING_ALIGNMENT bytes
+    """
+    if (isinstance(embeddings, np.ndarray) and embeddings.dtype == np.float32
+            and embeddings.flags['C_CONTIGUOUS']
+            and embeddings.ctypes.data % EMBEDDING_ALIGNMENT == 0):
+        return embeddings
+    
+    array = np.asarray(embeddings, dtype=np.float32)
+    aligned = _aligned_empty(array.shape, np.float32)
+    np.copyto(aligned, array)
+    return aligned
+
+
+def _is_unit_norm(embeddings: np.ndarray) -> bool:
+    """
+    Check whether every row has unit L2 norm (OpenAI text-embedding-3-* vectors do)
+    
+    Args:
+        embeddings: Embedding matrix of shape (n_vectors, dimension)
+        
+    Returns:
+        True if all rows are L2-normalized
+    """
+    squared_norms = np.einsum('ij,ij->i', embeddings, embeddings)
+    return bool(np.allclose(squared_norms, 1.0, atol=UNIT_NORM_TOLERANCE))
+
+
+def _cosine_numpy(query_vectors: np.ndarray, embeddings_normalized: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity via NumPy (BLAS SGEMM) - portable fallback kernel
+    
+    Args:
+        query_vectors: Query vectors of shape (n_queries, dimension)
+        embeddings_normalized: Unit-norm embeddings of shape (n_vectors, dimension)
+        
+    Returns:
+        Similarity matrix of shape (n_queries, n_vectors)
+    """
+    query_norms = np.linalg.norm(query_vectors, axis=1, keepdims=True)
+    if not np.allclose(query_norms, 1.0, atol=UNIT_NORM_TOLERANCE):
+        query_norms[query_norms == 0] = 1.0
+        query_vectors = query_vectors / query_norms
+    return query_vectors @ embeddings_normalized.T
+
+
+def _cosine_simsimd(query_vectors: np.ndarray, embeddings_normalized: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity via SimSIMD's hardware-specific kernels
+    Batched queries stay on BLAS GEMM, which beats row-by-row kernels there.
+    
+    Args:
+        query_vectors: Query vectors of shape (n_queries, dimension)
+        embeddings_normalized: Unit-norm embeddings of shape (n_vectors, dimension)
+        
+    Returns:
+        Similarity matrix of shape (n_queries, n_vectors)
+    """
+    if len(query_vectors) > 1:
+        return _cosine_numpy(query_vectors, embeddings_normalized)
+    
+    distances = np.asarray(simsimd.cdist(query_vectors, embeddings_normalized, metric="cosine"))
+    return 1.0 - distances.astype(np.float32, copy=False)
+
+
+@lru_cache(maxsize=None)
+def _select_cosine_kernel() -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Pick the fastest cosine kernel available on this machine (probed once per process)
+    
+    Returns:
+        SimSIMD kernel if it has a SIMD backend for this CPU and beats NumPy/BLAS
+        on a timed probe, else the NumPy kernel
+    """
+    if simsimd is None:
+        return _cosine_numpy
+    capabilities = simsimd.get_capabilities()
+    if not any(capabilities.get(name) for name in SIMSIMD_SIMD_CAPABILITIES):
+        return _cosine_numpy
+    
+    # A SIMD backend is not enough - multithreaded BLAS often wins on large matrices
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal(COSINE_PROBE_SHAPE, dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    query = rng.standard_normal((1, COSINE_PROBE_SHAPE[1]), dtype=np.float32)
+    
+    def best_time(kernel):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            kernel(query, embeddings)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    
+    return _cosine_simsimd if best_time(_cosine_simsimd) < best_time(_cosine_numpy) else _cosine_numpy
+
+
+def _cached_is_normalized(data: Dict[str, Any], embeddings: np.ndarray) -> bool:
+    """
+    Get the unit-norm flag saved with a cache, checking the matrix only for older caches
+    
+    Args:
+        data: Cache data dict as read from disk
+        embeddings: Loaded embedding matrix (possibly memory-mapped)
+        
+    Returns:
+        True if the embeddings are already L2-normalized
+    """
+    # Saved at write time - recomputing it would read the whole (mmap'd) file
+    if 'is_normalized' in data:
+        return bool(data['is_normalized'])
+    return _is_unit_norm(embeddings)
+
+
+def _deserialize_pinecone_meta(meta: Dict[str, Any],
+                               json_cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Decode JSON fields (like notes_raw) that Pinecone metadata stores as '<key>_json' strings
+    
+    Args:
+        meta: Metadata dict as returned by Pinecone
+        json_cache: Optional decoded values keyed by their raw JSON string
+        
+    Returns:
+        Copy of the metadata with each '<key>_json' replaced by decoded '<key>'
+        (kept as-is if it fails to decode)
+    """
+    deserialized_meta = dict(meta)
+    for key in [key for key in deserialized_meta if key.endswith('_json')]:
+        value = deserialized_meta[key]
+        if isinstance(value, str):
+            if json_cache is not None and value in json_cache:
+                decoded = json_cache[value]
+            else:
+                try:
+                    decoded = json.loads(value)
+                except ValueError:
+                    continue
+                if json_cache is not None:
+                    json_cache[value] = decoded
+            deserialized_meta[key[:-5]] = decoded
+            del deserialized_meta[key]
+    return deserialized_meta
+
+
+def _swap_remove(array: np.ndarray, index: int) -> np.ndarray:
+    """
+    Remove a row by overwriting it with the last row and shrinking the view by one
+    
+    Args:
+        array: Array to remove from (modified in place)
+        index: Row to remove
+        
+    Returns:
+        View of the array without its last row
+    """
+    last = len(array) - 1
+    if index != last:
+        array[index] = array[last]
+    return array[:last]
+
+
+def _embeddings_sidecar_path(file_path: str) -> str:
+    """Path of the raw .npy embedding matrix stored next to a pickled cache file"""
+    return f"{file_path}.npy"
+
+
+def _faiss_sidecar_path(file_path: str) -> str:
+    """Path of the FAISS index stored next to a pickled cache file"""
+    return f"{file_path}.faiss"
+
+
+def _embeddings_checksum(embeddings: np.ndarray) -> str:
+    """
+    Hash the raw bytes of an embedding matrix (ties a persisted FAISS index to it)
+    
+    Args:
+        embeddings: Embedding matrix
+        
+    Returns:
+        xxh3 hex digest of the matrix shape and contents
+    """
+    hasher = xxhash.xxh3_64(str(embeddings.shape).encode())
+    hasher.update(np.ascontiguousarray(embeddings))
+    return hasher.hexdigest()
+
+
+def _load_embeddings(path: str, mmap: bool = False) -> np.ndarray:
+    """
+    Read an .npy embedding matrix directly into an aligned buffer
+    
+    The array bytes are read once into their final location - no intermediate
+    copy as with an ndarray pickled inline.
+    
+    Args:
+        path: Path to .npy file
+        mmap: Memory-map the file (copy-on-write) instead of reading it into RAM
+        
+    Returns:
+        Aligned float32 embedding matrix
+    """
+    if mmap:
+        # Pages are read lazily from the page cache; in-place edits stay private
+        return np.load(path, mmap_mode='c', allow_pickle=False)
+    
+    with open(path, 'rb') as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            fortran_order, dtype = True, None  # Unknown header - let NumPy parse it
+        
+        if fortran_order or dtype != np.float32:
+            f.seek(0)
+            return _as_aligned(np.load(f, allow_pickle=False))
+        
+        embeddings = _aligned_empty(shape, np.float32)
+        if f.readinto(memoryview(embeddings).cast('B')) != embeddings.nbytes:
+            raise ValueError(f"Truncated embeddings file: {path}")
+    
+    return embeddings
+
+
+def _filter_field_names() -> List[str]:
+    """
+    Get metadata field names that filters are commonly applied to
+    
+    Returns:
+        Field names from FILTER_FIELD_NAMES and ADVANCED_FILTERS
+    """
+    names = list(config.FILTER_FIELD_NAMES.values())
+    for filter_config in config.ADVANCED_FILTERS:
+        field_config = config.FIELD_MAP.get(filter_config.get('field_index'))
+        if field_config and field_config['name'] not in names:
+            names.append(field_config['name'])
+    return names
 
 
 class VectorStore:
@@ -24,6 +321,12 @@ class VectorStore:
         self.embeddings = None  # numpy array of embeddings (for local storage)
         self.metadata = []  # List of vendor records (for local storage)
         self.dimension = None
+        self._meta_cache = {}  # Decoded Pinecone '<key>_json' values keyed by their raw JSON string
+        self._field_cols = None  # Lowercased filter columns, built lazily from metadata
+        self._embeddings_normalized = None  # Unit-norm copy of embeddings, built lazily
+        self._is_normalized = False  # True when embeddings are already unit-norm
+        self._cosine_kernel = _select_cosine_kernel()  # Chosen once for this CPU
+        self._faiss_index = None  # FAISS index over normalized embeddings, built lazily
         
         # Get storage mode from config
         self.storage_mode = config.STORAGE_MODE  # "pinecone_only", "local_only", or "hybrid"
@@ -34,6 +337,8 @@ class VectorStore:
         
         if self.use_pinecone:
             try:
+                # Imported lazily so the Pinecone client is only loaded when enabled
+                from core.pinecone_store import PineconeVectorStore
                 self.pinecone_store = PineconeVectorStore()
                 if self.storage_mode == "pinecone_only":
                     print(f"✅ Using Pinecone ONLY (cloud storage, no local cache)")
@@ -59,27 +364,33 @@ class VectorStore:
         if len(embeddings) != len(metadata):
             raise ValueError("Number of embeddings must match number of metadata items")
         
-        # Convert to numpy array for efficient computation
-        embeddings_array = np.array(embeddings)
+        # Convert to an aligned float32 matrix for efficient SIMD computation
+        embeddings_array = _as_aligned(embeddings)
+        batch_is_normalized = _is_unit_norm(embeddings_array)
         
         # Store in Pinecone if enabled
         if self.use_pinecone and self.pinecone_store:
             self.pinecone_store.upsert_embeddings(embeddings_array, metadata)
+            self._meta_cache = {}
             # Also keep in memory for quick access
             self.metadata = list(metadata)
             self.embeddings = embeddings_array
             self.dimension = embeddings_array.shape[1]
+            self._is_normalized = batch_is_normalized
         else:
             # Local storage only
             if self.embeddings is None:
                 self.embeddings = embeddings_array
                 self.metadata = list(metadata)
                 self.dimension = embeddings_array.shape[1]
+                self._is_normalized = batch_is_normalized
             else:
                 # Append to existing embeddings
-                self.embeddings = np.vstack([self.embeddings, embeddings_array])
+                self.embeddings = _as_aligned(np.vstack([self.embeddings, embeddings_array]))
                 self.metadata.extend(metadata)
+                self._is_normalized = self._is_normalized and batch_is_normalized
         
+        self._reset_local_caches()
         print(f"✓ Added {len(embeddings)} embeddings. Total: {len(self.metadata)}")
     
     def search(self, query_embedding: List[float], top_k: int = 5, 
@@ -110,56 +421,27 @@ class VectorStore:
                 # Build results
                 results = []
                 
-                if self.storage_mode == "pinecone_only":
-                    # Cloud-only mode: use metadata from Pinecone
-                    import json
-                    for meta, similarity_score in zip(metadata_list, similarities):
-                        # Deserialize JSON fields (like notes_raw)
-                        deserialized_meta = dict(meta)
-                        for key, value in meta.items():
-                            if key.endswith('_json') and isinstance(value, str):
-                                try:
-                                    original_key = key[:-5]  # Remove '_json' suffix
-                                    deserialized_meta[original_key] = json.loads(value)
-                                    del deserialized_meta[key]  # Remove the _json version
-                                except:
-                                    pass  # Keep original if deserialization fails
-                        
-                        result = {
-                            **deserialized_meta,
-                            'similarity_score': float(similarity_score)
-                        }
-                        results.append((result, float(similarity_score)))
-                else:
+                if self.storage_mode != "pinecone_only" and self.metadata:
                     # Hybrid mode: use metadata from local cache
-                    import json
-                    if not self.metadata:
-                        print("⚠️  No local metadata - falling back to Pinecone metadata")
-                        for meta, similarity_score in zip(metadata_list, similarities):
-                            # Deserialize JSON fields (like notes_raw)
-                            deserialized_meta = dict(meta)
-                            for key, value in meta.items():
-                                if key.endswith('_json') and isinstance(value, str):
-                                    try:
-                                        original_key = key[:-5]  # Remove '_json' suffix
-                                        deserialized_meta[original_key] = json.loads(value)
-                                        del deserialized_meta[key]  # Remove the _json version
-                                    except:
-                                        pass  # Keep original if deserialization fails
-                            
+                    for idx, similarity_score in zip(indices, similarities):
+                        if idx < len(self.metadata):
+                            similarity_score = float(similarity_score)
                             result = {
-                                **deserialized_meta,
-                                'similarity_score': float(similarity_score)
+                                **self.metadata[idx],
+                                'similarity_score': similarity_score
                             }
-                            results.append((result, float(similarity_score)))
-                    else:
-                        for idx, similarity_score in zip(indices, similarities):
-                            if idx < len(self.metadata):
-                                result = {
-                                    **self.metadata[idx],
-                                    'similarity_score': float(similarity_score)
-                                }
-                                results.append((result, float(similarity_score)))
+                            results.append((result, similarity_score))
+                else:
+                    # Cloud-only mode (or hybrid without local cache): use metadata from Pinecone
+                    if self.storage_mode != "pinecone_only":
+                        print("⚠️  No local metadata - falling back to Pinecone metadata")
+                    for meta, similarity_score in zip(metadata_list, similarities):
+                        similarity_score = float(similarity_score)
+                        result = {
+                            **self._get_pinecone_meta(meta),
+                            'similarity_score': similarity_score
+                        }
+                        results.append((result, similarity_score))
                 
                 return results
             except Exception as e:
@@ -167,21 +449,147 @@ class VectorStore:
                 print(f"   Falling back to local search")
         
         # Local cosine similarity search
+        return self.search_batch(query_vector, top_k=top_k)[0]
+    
+    def search_batch(self, query_embeddings: List[List[float]],
+                     top_k: int = 5) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Search local embeddings for several queries at once
+        
+        All queries are scored with a single matrix multiplication (one BLAS GEMM)
+        instead of one pass over the embeddings per query.
+        
+        Args:
+            query_embeddings: Query vectors, one per query
+            top_k: Number of results to return per query
+            
+        Returns:
+            One list of (metadata, similarity_score) tuples per query, sorted by similarity
+        """
         if self.embeddings is None or len(self.embeddings) == 0:
-            return []
+            return [[] for _ in query_embeddings]
         
-        # Calculate cosine similarity
-        similarities = cosine_similarity(query_vector, self.embeddings)[0]
+        query_vectors = np.asarray(query_embeddings, dtype=np.float32).reshape(-1, self.embeddings.shape[1])
         
         # Get top K indices (get more to allow for post-boost filtering)
         # Don't apply threshold here - it will be applied after keyword boosting
-        top_indices = np.argsort(similarities)[::-1][:top_k * 3]  # Get 3x results for boost filtering
+        top_indices, top_scores = self._local_top_indices(query_vectors, top_k * 3)  # Get 3x results for boost filtering
         
+        return [
+            self._build_local_results(indices, scores)
+            for indices, scores in zip(top_indices, top_scores)
+        ]
+    
+    def _local_top_indices(self, query_vectors: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank local embeddings by cosine similarity to each query
+        
+        Args:
+            query_vectors: Query vectors of shape (n_queries, dimension)
+            n: Number of top indices to return per query
+            
+        Returns:
+            Tuple of (top indices, their similarities), each of shape (n_queries, n)
+            and sorted by similarity
+        """
+        query_vectors = np.ascontiguousarray(query_vectors, dtype=np.float32)
+        n = min(n, len(self.embeddings))
+        
+        # Nothing to rank (e.g. top_k=0) - FAISS rejects k=0
+        if n <= 0:
+            empty = np.empty((len(query_vectors), 0))
+            return empty.astype(np.int64), empty.astype(np.float32)
+        
+        if faiss is not None:
+            return self._faiss_top_indices(query_vectors, n)
+        
+        # Embeddings are normalized once and cached; the kernel normalizes the queries
+        similarities = self._cosine_kernel(query_vectors, self._get_normalized_embeddings())
+        
+        # Partial selection of the top n, then sort only those
+        if n < similarities.shape[1]:
+            candidates = np.argpartition(-similarities, n - 1, axis=1)[:, :n]
+        else:
+            candidates = np.broadcast_to(np.arange(n), similarities.shape)
+        order = np.argsort(-np.take_along_axis(similarities, candidates, axis=1), axis=1, kind='stable')
+        top_indices = np.take_along_axis(candidates, order, axis=1)
+        return top_indices, np.take_along_axis(similarities, top_indices, axis=1)
+    
+    def _faiss_top_indices(self, query_vectors: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank local embeddings with the FAISS inner-product index
+        
+        Args:
+            query_vectors: Query vectors of shape (n_queries, dimension)
+            n: Number of top indices to return per query
+            
+        Returns:
+            Tuple of (top indices, their similarities), each of shape (n_queries, n)
+        """
+        index = self._get_faiss_index()
+        if hasattr(index, 'hnsw'):
+            index.hnsw.efSearch = max(config.FAISS_HNSW_EF_SEARCH, n)
+        
+        query_vectors = query_vectors.copy()
+        faiss.normalize_L2(query_vectors)
+        top_scores, top_indices = index.search(query_vectors, n)
+        return top_indices, top_scores
+    
+    def _get_faiss_index(self):
+        """
+        Get the FAISS index over the normalized embeddings, built on first use
+        Exact IndexFlatIP for small stores, IndexHNSWFlat (sub-linear, approximate) for large ones.
+        
+        Returns:
+            FAISS index
+        """
+        if self._faiss_index is None:
+            dimension = self.embeddings.shape[1]
+            if len(self.embeddings) >= config.FAISS_HNSW_MIN_VECTORS:
+                index = faiss.IndexHNSWFlat(dimension, config.FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            else:
+                index = faiss.IndexFlatIP(dimension)
+            index.add(self._get_normalized_embeddings())
+            self._faiss_index = index
+        return self._faiss_index
+    
+    def _get_normalized_embeddings(self) -> np.ndarray:
+        """
+        Get the unit-norm embedding matrix used for cosine similarity
+        
+        Returns:
+            Aligned float32 matrix of L2-normalized embeddings
+        """
+        # Already unit-norm (e.g. OpenAI embeddings) - no copy needed
+        if self._is_normalized:
+            return self.embeddings
+        
+        if self._embeddings_normalized is None:
+            norms = np.linalg.norm(self.embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            normalized = _aligned_empty(self.embeddings.shape, np.float32)
+            np.divide(self.embeddings, norms, out=normalized)
+            self._embeddings_normalized = normalized
+        return self._embeddings_normalized
+    
+    def _build_local_results(self, indices: np.ndarray,
+                             scores: np.ndarray) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Build (metadata, score) results for local embedding indices
+        
+        Args:
+            indices: Indices into local metadata (-1 entries are skipped)
+            scores: Similarity score of each index
+            
+        Returns:
+            List of tuples (metadata, similarity_score)
+        """
         # Build results WITHOUT applying match boost here
         # Match boost will be applied in query_engine AFTER keyword boosting
         results = []
-        for idx in top_indices:
-            similarity_score = float(similarities[idx])
+        for idx, similarity_score in zip(indices.tolist(), scores.tolist()):
+            if idx < 0:
+                continue  # FAISS pads with -1 when HNSW finds fewer than requested
             
             result = {
                 **self.metadata[idx],
@@ -207,8 +615,30 @@ class VectorStore:
         Returns:
             Filtered results sorted by similarity
         """
+        candidate_k = min(len(self.metadata), top_k * 3)
+        
+        # Local search: match filters against precomputed lowercased columns in one
+        # vectorized pass over the candidates instead of per-result dict lookups
+        local_search = (not (self.use_pinecone and self.pinecone_store)
+                        and self.embeddings is not None and len(self.embeddings) > 0)
+        field_cols = self._get_field_columns() if local_search else {}
+        if local_search and all(field in field_cols and isinstance(value, str)
+                                for field, value in filters.items()):
+            query_vector = np.array(query_embedding).reshape(1, -1)
+            # search() over-fetches 3x, keep the same candidate set
+            top_indices, top_scores = self._local_top_indices(query_vector, candidate_k * 3)
+            keep = top_indices[0] >= 0
+            top_indices, top_scores = top_indices[0][keep], top_scores[0][keep]
+            
+            mask = np.ones(len(top_indices), dtype=bool)
+            for field, value in filters.items():
+                lowered, is_str = field_cols[field]
+                mask &= is_str[top_indices] & (np.char.find(lowered[top_indices], value.lower()) >= 0)
+            
+            return self._build_local_results(top_indices[mask], top_scores[mask])
+        
         # First, get a larger set of results (get 3x more for filtering + boosting)
-        all_results = self.search(query_embedding, top_k=min(len(self.metadata), top_k * 3), threshold=None)
+        all_results = self.search(query_embedding, top_k=candidate_k, threshold=None)
         
         # Apply filters
         filtered_results = []
@@ -233,6 +663,49 @@ class VectorStore:
         
         return filtered_results
     
+    def _get_field_columns(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get lowercased string columns of the filter fields, built once from local metadata
+        Fields holding non-string values are skipped and filtered per result instead.
+        
+        Returns:
+            Dict of field name -> (lowercased values, mask of rows holding a string)
+        """
+        if self._field_cols is None:
+            self._field_cols = {}
+            for field in _filter_field_names():
+                values = [record.get(field) for record in self.metadata]
+                if not all(value is None or isinstance(value, str) for value in values):
+                    continue
+                is_str = np.array([value is not None for value in values], dtype=bool)
+                lowered = np.array([value.lower() if value is not None else '' for value in values], dtype=str)
+                self._field_cols[field] = (lowered, is_str)
+        return self._field_cols
+    
+    def _reset_local_caches(self):
+        """Drop data derived from local embeddings/metadata after they change"""
+        self._field_cols = None
+        self._embeddings_normalized = None
+        self._faiss_index = None
+    
+    def _get_pinecone_meta(self, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get deserialized Pinecone metadata
+        
+        JSON fields are decoded once per distinct JSON string. The cache is keyed on
+        content, not vector index, so a re-index by another process (which reassigns
+        indices to different vendors) can never serve a stale vendor's details.
+        
+        Args:
+            meta: Metadata dict as returned by Pinecone
+            
+        Returns:
+            Deserialized metadata
+        """
+        if len(self._meta_cache) > PINECONE_META_CACHE_SIZE:
+            self._meta_cache = {}
+        return _deserialize_pinecone_meta(meta, self._meta_cache)
+    
     def get_all_metadata(self) -> List[Dict[str, Any]]:
         """
         Get all stored metadata
@@ -249,7 +722,6 @@ class VectorStore:
         if self.storage_mode == "pinecone_only" and self.use_pinecone and self.pinecone_store:
             try:
                 # Query with a dummy vector to get all metadata
-                import numpy as np
                 dummy_query = np.zeros(3072)  # Match embedding dimension
                 
                 # Get all vectors (use large top_k)
@@ -264,19 +736,7 @@ class VectorStore:
                     )
                     
                     # Deserialize JSON fields
-                    import json
-                    deserialized_metadata = []
-                    for meta in metadata_list:
-                        deserialized_meta = dict(meta)
-                        for key, value in meta.items():
-                            if key.endswith('_json') and isinstance(value, str):
-                                try:
-                                    original_key = key[:-5]
-                                    deserialized_meta[original_key] = json.loads(value)
-                                    del deserialized_meta[key]
-                                except:
-                                    pass
-                        deserialized_metadata.append(deserialized_meta)
+                    deserialized_metadata = [self._get_pinecone_meta(meta) for meta in metadata_list]
                     
                     # Cache it locally for performance
                     self.metadata = deserialized_metadata
@@ -300,6 +760,9 @@ class VectorStore:
         self.embeddings = None
         self.metadata = []
         self.dimension = None
+        self._is_normalized = False
+        self._meta_cache = {}
+        self._reset_local_caches()
         
         # Clear Pinecone index if enabled
         if self.use_pinecone and self.pinecone_store:
@@ -331,6 +794,7 @@ class VectorStore:
                     self.pinecone_store.delete_all()
                     # Upload new vectors with fingerprint
                     self.pinecone_store.upsert_embeddings(self.embeddings, self.metadata, db_fingerprint)
+                    self._meta_cache = {}
                     print(f"✅ Successfully synced to Pinecone (no local cache)")
                     return
                 except Exception as e:
@@ -344,17 +808,45 @@ class VectorStore:
         # Local-only or hybrid mode: save to local cache
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
+        # Embeddings go to a raw .npy sidecar; only the (small) metadata is pickled
+        sidecar_path = _embeddings_sidecar_path(file_path)
+        if self.embeddings is not None:
+            # Write to a temp file and swap it in - the current sidecar may be
+            # memory-mapped by self.embeddings and must not be truncated under it
+            with open(f"{sidecar_path}.tmp", 'wb') as f:
+                np.save(f, self.embeddings, allow_pickle=False)
+            os.replace(f"{sidecar_path}.tmp", sidecar_path)
+        elif os.path.exists(sidecar_path):
+            # No embeddings (e.g. after clear()) - drop the old matrix so it
+            # isn't loaded back against the new (empty) metadata
+            os.remove(sidecar_path)
+        
+        # Build and persist the FAISS index so large HNSW indices aren't rebuilt on
+        # every start (local loads, including hybrid's fallback, read it back). It is
+        # tagged with a checksum of the embeddings it indexes; any older sidecar is
+        # removed so it can't be reused
+        faiss_path = _faiss_sidecar_path(file_path)
+        faiss_checksum = None
+        if faiss is not None and self.embeddings is not None and len(self.embeddings) > 0:
+            faiss.write_index(self._get_faiss_index(), faiss_path)
+            faiss_checksum = _embeddings_checksum(self.embeddings)
+        elif os.path.exists(faiss_path):
+            os.remove(faiss_path)
+        
         data = {
-            'embeddings': self.embeddings,
+            'embeddings': None,  # Stored in the .npy sidecar
             'metadata': self.metadata,
             'dimension': self.dimension,
             'db_fingerprint': db_fingerprint,
-            'vendor_count': len(self.metadata)
+            'vendor_count': len(self.metadata),
+            'has_embeddings_sidecar': self.embeddings is not None,
+            'is_normalized': self._is_normalized,
+            'faiss_checksum': faiss_checksum
         }
         
         # Save locally (for backup and metadata)
         with open(file_path, 'wb') as f:
-            pickle.dump(data, f)
+            pickle.dump(data, f, protocol=5)
         
         print(f"✓ Saved vector store with {len(self.metadata)} items to {file_path}")
         
@@ -366,6 +858,7 @@ class VectorStore:
                 self.pinecone_store.delete_all()
                 # Upload new vectors with fingerprint
                 self.pinecone_store.upsert_embeddings(self.embeddings, self.metadata, db_fingerprint)
+                self._meta_cache = {}
                 print(f"✅ Successfully synced to Pinecone")
             except Exception as e:
                 print(f"⚠️  Failed to sync to Pinecone: {e}")
@@ -381,24 +874,40 @@ class VectorStore:
         Returns:
             Fingerprint string (hash of critical fields)
         """
-        import hashlib
-        import json
+        # Pack ID, updated_at, and notes_count of each vendor (sorted by ID for
+        # consistent hashing) into one buffer and hash it with non-cryptographic xxh3.
+        # Values are hashed as text - notes_count may be a str or float (e.g. from CSV)
+        buffer = bytearray()
+        for vendor in sorted(metadata, key=lambda x: x.get('id', 0)):
+            buffer += str(vendor.get('id')).encode()
+            buffer += b'\x00'
+            buffer += str(vendor.get('updated_at') or '').encode()
+            buffer += b'\x00'
+            buffer += str(vendor.get('notes_count') or 0).encode()
+            buffer += b'\x00'
+        
+        return xxhash.xxh3_64_hexdigest(buffer)
+    
+    def _calculate_legacy_db_fingerprint(self, metadata: List[Dict[str, Any]]) -> str:
+        """
+        Calculate the MD5 fingerprint written by earlier versions (for caches saved before xxh3)
         
-        # Create fingerprint from vendor IDs and updated_at timestamps
-        fingerprint_data = []
-        for vendor in metadata:
-            # Include ID, updated_at, and notes_count for change detection
-            fp = {
+        Args:
+            metadata: List of vendor records
+            
+        Returns:
+            MD5 hex digest of the JSON-encoded critical fields
+        """
+        fingerprint_data = [
+            {
                 'id': vendor.get('id'),
                 'updated_at': vendor.get('updated_at', ''),
                 'notes_count': vendor.get('notes_count', 0)
             }
-            fingerprint_data.append(fp)
-        
-        # Sort by ID for consistent hashing
+            for vendor in metadata
+        ]
         fingerprint_data.sort(key=lambda x: x.get('id', 0))
         
-        # Create hash
         fingerprint_str = json.dumps(fingerprint_data, sort_keys=True)
         return hashlib.md5(fingerprint_str.encode()).hexdigest()
     
@@ -445,15 +954,20 @@ class VectorStore:
                         print(f"✅ Found embeddings in Pinecone")
                         # Load local cache for metadata and fingerprinting
                         if os.path.exists(file_path):
-                            with open(file_path, 'rb') as f:
-                                data = pickle.load(f)
+                            # Vectors are served by Pinecone - map the local copy
+                            # instead of reading it into memory
+                            data = self._read_cache_file(file_path, mmap=True)
                             
                             self.embeddings = data.get('embeddings')
+                            if self.embeddings is not None:
+                                self.embeddings = _as_aligned(self.embeddings)
+                                self._is_normalized = _cached_is_normalized(data, self.embeddings)
                             self.metadata = data.get('metadata', [])
                             self.dimension = data.get('dimension')
                             self.db_fingerprint = data.get('db_fingerprint')
                             self.vendor_count = data.get('vendor_count', len(self.metadata))
                             
+                            self._reset_local_caches()
                             print(f"✓ Loaded {len(self.metadata)} items (metadata from local, vectors from Pinecone)")
                             return True
                         else:
@@ -469,18 +983,66 @@ class VectorStore:
             print(f"No vector store found at {file_path}")
             return False
         
-        with open(file_path, 'rb') as f:
-            data = pickle.load(f)
+        data = self._read_cache_file(file_path)
         
         self.embeddings = data.get('embeddings')
+        if self.embeddings is not None:
+            self.embeddings = _as_aligned(self.embeddings)
+            self._is_normalized = _cached_is_normalized(data, self.embeddings)
         self.metadata = data.get('metadata', [])
         self.dimension = data.get('dimension')
         self.db_fingerprint = data.get('db_fingerprint')
         self.vendor_count = data.get('vendor_count', len(self.metadata))
         
+        self._reset_local_caches()
+        self._load_faiss_index(file_path, data.get('faiss_checksum'))
         print(f"✓ Loaded vector store with {len(self.metadata)} items from {file_path}")
         return True
     
+    def _read_cache_file(self, file_path: str, mmap: bool = False) -> Dict[str, Any]:
+        """
+        Read a local cache file and its embeddings sidecar
+        
+        Args:
+            file_path: Path to pickled cache file
+            mmap: Memory-map the embeddings sidecar instead of reading it
+            
+        Returns:
+            Cache data dict (embeddings included)
+        """
+        with open(file_path, 'rb') as f:
+            data = pickle.load(f)
+        
+        # Older caches keep the embeddings inline in the pickle. Newer ones record
+        # whether they wrote a sidecar, so a leftover .npy is never paired with them
+        sidecar_path = _embeddings_sidecar_path(file_path)
+        has_sidecar = data.get('has_embeddings_sidecar', os.path.exists(sidecar_path))
+        if data.get('embeddings') is None and has_sidecar:
+            data['embeddings'] = _load_embeddings(sidecar_path, mmap=mmap)
+        
+        return data
+    
+    def _load_faiss_index(self, file_path: str, faiss_checksum: Optional[str]):
+        """
+        Load the persisted FAISS index if it was built from the loaded embeddings
+        
+        Args:
+            file_path: Path to pickled cache file
+            faiss_checksum: Embeddings checksum saved alongside the index (None if none saved)
+        """
+        faiss_path = _faiss_sidecar_path(file_path)
+        if (faiss is None or self.embeddings is None or not faiss_checksum
+                or not os.path.exists(faiss_path)):
+            return
+        
+        # Same shape is not enough - different embeddings would return wrong neighbors
+        if _embeddings_checksum(self.embeddings) != faiss_checksum:
+            return
+        
+        index = faiss.read_index(faiss_path)
+        if index.ntotal == len(self.embeddings) and index.d == self.embeddings.shape[1]:
+            self._faiss_index = index
+    
     def is_stale(self, current_metadata: List[Dict[str, Any]]) -> bool:
         """
         Check if cached vector store is stale compared to current database
@@ -504,6 +1066,12 @@ class VectorStore:
         # Calculate current fingerprint
         current_fingerprint = self._calculate_db_fingerprint(current_metadata)
         
+        # Caches saved by earlier versions hold a 32-char MD5 fingerprint - compare it
+        # with the legacy scheme once instead of forcing a full re-embedding
+        if len(self.db_fingerprint) == 32 and self.db_fingerprint != current_fingerprint:
+            if self._calculate_legacy_db_fingerprint(current_metadata) == self.db_fingerprint:
+                self.db_fingerprint = current_fingerprint
+        
         # Compare fingerprints
         if current_fingerprint != self.db_fingerprint:
             print("⚠ Database content changed (updates/edits/notes) - will rebuild cache")
@@ -522,6 +1090,7 @@ class VectorStore:
         """
         if 0 <= index < len(self.metadata):
             self.metadata[index] = new_metadata
+            self._reset_local_caches()
         else:
             raise IndexError(f"Index {index} out of range")
     
@@ -537,8 +1106,10 @@ class VectorStore:
         if 0 <= index < len(self.metadata):
             # Update embedding
             self.embeddings[index] = np.array(new_embedding)
+            self._is_normalized = self._is_normalized and _is_unit_norm(self.embeddings[index:index + 1])
             # Update metadata
             self.metadata[index] = new_metadata
+            self._reset_local_caches()
         else:
             raise IndexError(f"Index {index} out of range")
     
@@ -546,11 +1117,26 @@ class VectorStore:
         """
         Delete an item from the vector store
         
+        The last item is moved into the freed slot (O(dimension) instead of copying
+        the whole matrix), so the order of the remaining items is NOT preserved.
+        
         Args:
             index: Index of item to delete
         """
         if 0 <= index < len(self.metadata):
-            self.embeddings = np.delete(self.embeddings, index, axis=0)
-            del self.metadata[index]
+            last = len(self.metadata) - 1
+            self.embeddings = _swap_remove(self.embeddings, index)
+            self.metadata[index] = self.metadata[last]
+            self.metadata.pop()
+            
+            # Keep derived data in step instead of rebuilding it
+            if self._embeddings_normalized is not None:
+                self._embeddings_normalized = _swap_remove(self._embeddings_normalized, index)
+            if self._field_cols is not None:
+                self._field_cols = {
+                    field: (_swap_remove(lowered, index), _swap_remove(is_str, index))
+                    for field, (lowered, is_str) in self._field_cols.items()
+                }
+            self._faiss_index = None  # FAISS indices can't move rows; rebuilt on next search
         else:
             raise IndexError(f"Index {index} out of range")
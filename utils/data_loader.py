@@ -3,11 +3,173 @@ Data Loader Module
 Handles loading vendor data from various sources (JSON, CSV, Excel, SQL Database)
 """
 
+import hashlib
 import json
+import pickle
+import re
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 import os
 
+# Optional: faster JSON parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: streaming JSON parsing (records are parsed one at a time)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: MySQL connection pooling (connections are reused across loads)
+try:
+    from dbutils.pooled_db import PooledDB
+except ImportError:
+    PooledDB = None
+
+# Rows fetched per round trip when streaming from MySQL / PostgreSQL
+MYSQL_FETCH_SIZE = 10_000
+POSTGRES_FETCH_SIZE = 5000
+
+# CSV columns converted back to numbers after reading every cell as text
+# (they feed the cache fingerprint, which must see 5, not '5')
+CSV_NUMERIC_COLUMNS = ('id', 'notes_count')
+
+# Version of the parsed-record format in load() memos - bump when parsing or
+# validation changes what records look like, so older memos are not reused
+LOAD_CACHE_VERSION = 2
+
+
+def _process_notes(notes_data: Any) -> Tuple[str, List[Any], int]:
+    """
+    Convert a PostgreSQL notes value into searchable text with temporal context
+    
+    Args:
+        notes_data: Raw notes column value (list of {comment, timestamp} objects)
+        
+    Returns:
+        Tuple of (searchable notes text, original notes array, notes count)
+    """
+    if not notes_data:
+        return '', [], 0
+    
+    if not isinstance(notes_data, list):
+        return str(notes_data), [], 0
+    
+    # Sort notes by timestamp (newest first) to prioritize recent comments
+    sorted_notes = sorted(notes_data, key=lambda x: x.get('timestamp', ''), reverse=True)
+    last = len(sorted_notes) - 1
+    
+    # Build searchable text with temporal indicators
+    searchable_parts = []
+    for idx, note in enumerate(sorted_notes):
+        if not (isinstance(note, dict) and 'comment' in note):
+            continue
+        comment = note['comment']
+        
+        # Most recent comment gets emphasis, oldest is marked as earlier
+        if idx == 0:
+            searchable_parts.append(f"RECENT: {comment}")
+        elif idx == last:
+            searchable_parts.append(f"EARLIER: {comment}")
+        else:
+            searchable_parts.append(comment)
+        
+        # Add year/month context from the timestamp
+        timestamp = note.get('timestamp', '')
+        if timestamp:
+            try:
+                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                searchable_parts.append(f"[{dt.strftime('%Y-%m')}]")
+            except (AttributeError, TypeError, ValueError):
+                pass
+    
+    return ' | '.join(searchable_parts), notes_data, len(sorted_notes)
+
+
+def _parse_number(value: Any) -> Any:
+    """
+    Convert a numeric CSV cell back to int or float, as pandas' type inference would
+    
+    Args:
+        value: Cell text (or None for an empty cell)
+        
+    Returns:
+        int, float, or the value unchanged if it isn't a number
+    """
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _csv_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Turn a CSV frame read as text into records: empty cells become None and
+    numeric columns get their numbers back
+    
+    Args:
+        df: Frame read with dtype=object and na_filter=False
+        
+    Returns:
+        List of vendor dictionaries
+    """
+    df = df.mask(df.eq(''), None)
+    for column in CSV_NUMERIC_COLUMNS:
+        if column in df.columns:
+            # Built as an object Series so pandas doesn't re-infer a float column (and NaN)
+            df[column] = pd.Series([_parse_number(value) for value in df[column]],
+                                   index=df.index, dtype=object)
+    return df.to_dict('records')
+
+
+@lru_cache(maxsize=1)
+def _mysql_pool():
+    """
+    Get the shared MySQL connection pool (created on first use)
+    
+    Returns:
+        PooledDB handing out streaming (SSCursor) connections
+    """
+    import pymysql
+    from pymysql.cursors import SSCursor
+    from config import MYSQL_CONFIG
+    
+    return PooledDB(pymysql, maxconnections=8, blocking=True, cursorclass=SSCursor, **MYSQL_CONFIG)
+
+
+@lru_cache(maxsize=1)
+def _mysql_select() -> Tuple[str, Tuple[Tuple[Optional[str], str], ...]]:
+    """
+    Build the MySQL vendor SELECT and its column keys once
+    
+    Returns:
+        Tuple of (query, keys) where keys holds (logical name or None, field_X key)
+        for each selected field column, in SELECT order
+    """
+    from config import MYSQL_TABLE_NAME, FIELD_MAP, ACTIVE_FIELD_INDICES
+    
+    # Build SELECT query with all active field indices
+    field_columns = ", ".join([f"field_{i}" for i in ACTIVE_FIELD_INDICES])
+    query = f"SELECT id, {field_columns} FROM {MYSQL_TABLE_NAME}"
+    
+    keys = tuple(
+        (FIELD_MAP[idx]["name"] if idx in FIELD_MAP else None, f"field_{idx}")
+        for idx in ACTIVE_FIELD_INDICES
+    )
+    return query, keys
+
 
 class DataLoader:
     """Load and validate vendor data from different sources"""
@@ -45,8 +207,17 @@ class DataLoader:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Data file not found: {path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN/Infinity, which json.dump writes by default
+                data = json.loads(raw)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # Handle both list and dict with 'vendors' key
         if isinstance(data, dict) and 'vendors' in data:
@@ -56,6 +227,47 @@ class DataLoader:
         else:
             return data
     
+    def iter_from_json(self, file_path: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream vendor records from JSON file one at a time
+        Uses ijson when installed so the whole document is never held in memory,
+        otherwise falls back to load_from_json. ijson rejects NaN/Infinity (which
+        json.dump writes by default), so on a parse error the remaining records
+        are read with load_from_json instead.
+        
+        Args:
+            file_path: Path to JSON file
+            
+        Yields:
+            Vendor dictionaries
+        """
+        path = file_path or self.data_source
+        
+        if ijson is None:
+            yield from self.load_from_json(path)
+            return
+        
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Data file not found: {path}")
+        
+        with open(path, 'rb') as f:
+            # Handle both list and dict with 'vendors' key
+            head = f.read(1024).lstrip()
+            f.seek(0)
+            prefix = 'vendors.item' if head.startswith(b'{') else 'item'
+            
+            yielded = 0
+            try:
+                for record in ijson.items(f, prefix, use_float=True):
+                    yield record
+                    yielded += 1
+                return
+            except ijson.JSONError:
+                pass
+        
+        # Re-parse with the full-document loader and skip records already yielded
+        yield from islice(self.load_from_json(path), yielded, None)
+    
     def load_from_csv(self, file_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Load vendor data from CSV file
@@ -71,12 +283,10 @@ class DataLoader:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Data file not found: {path}")
         
-        df = pd.read_csv(path)
+        # Read cells as-is (no NaN promotion), then convert empty cells to None
+        df = pd.read_csv(path, dtype=object, keep_default_na=False, na_filter=False)
         
-        # Convert NaN to None for consistency
-        df = df.where(pd.notna(df), None)
-        
-        return df.to_dict('records')
+        return _csv_records(df)
     
     def load_from_excel(self, file_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -93,13 +303,85 @@ class DataLoader:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Data file not found: {path}")
         
-        df = pd.read_excel(path)
-        
-        # Convert NaN to None for consistency
-        df = df.where(pd.notna(df), None)
+        # Read cells as-is (no NaN promotion), then convert empty cells to None
+        df = pd.read_excel(path, dtype=object, keep_default_na=False, na_filter=False)
+        df = df.mask(df.eq(''), None)
         
         return df.to_dict('records')
     
+    def iter_chunks(self, file_path: Optional[str] = None,
+                    chunksize: int = 10_000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read vendor data from CSV or Excel file in chunks, without loading the whole file
+        
+        CSV cells are read as strings (no NaN promotion), .xlsx files are streamed with
+        openpyxl's read-only mode. Empty cells become None in both cases.
+        
+        Args:
+            file_path: Path to CSV or Excel file
+            chunksize: Number of records per chunk
+            
+        Yields:
+            Lists of vendor dictionaries
+        """
+        path = file_path or self.data_source
+        
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Data file not found: {path}")
+        
+        if path.endswith('.xlsx'):
+            yield from self._iter_xlsx_chunks(path, chunksize)
+        elif path.endswith('.xls'):
+            # Legacy .xls isn't supported by openpyxl - load once and slice
+            records = self.load_from_excel(path)
+            for start in range(0, len(records), chunksize):
+                yield records[start:start + chunksize]
+        else:
+            for chunk in pd.read_csv(path, chunksize=chunksize, dtype=object, na_filter=False):
+                yield _csv_records(chunk)
+    
+    def _iter_xlsx_chunks(self, path: str, chunksize: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream rows of the active sheet of an .xlsx file in chunks
+        
+        Args:
+            path: Path to .xlsx file
+            chunksize: Number of records per chunk
+            
+        Yields:
+            Lists of vendor dictionaries
+        """
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportError("openpyxl is required for Excel support. Install it with: pip install openpyxl")
+        
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            # First sheet, as pd.read_excel reads - not whichever tab was last active
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(name) if name is not None else f"Unnamed: {idx}" for idx, name in enumerate(header)]
+            
+            chunk = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue  # Skip blank rows
+                chunk.append({
+                    column: None if value == '' else value
+                    for column, value in zip(columns, row)
+                })
+                if len(chunk) >= chunksize:
+                    yield chunk
+                    chunk = []
+            
+            if chunk:
+                yield chunk
+        finally:
+            workbook.close()
+    
     def load_from_sql(self, database_url: str = None, table_name: str = None) -> List[Dict[str, Any]]:
         """
         Load vendor data from SQL database
@@ -128,8 +410,11 @@ class DataLoader:
         query = f"SELECT * FROM {table}"
         df = pd.read_sql(query, engine)
         
-        # Convert NaN to None for consistency
-        df = df.where(pd.notna(df), None)
+        # Convert NaN/NaT to None for consistency - object columns already hold None
+        # for SQL NULLs, so only typed columns that actually contain nulls are touched
+        for column in df.columns:
+            if df[column].dtype != object and df[column].hasnans:
+                df[column] = df[column].astype(object).where(df[column].notna(), None)
         
         return df.to_dict('records')
     
@@ -142,46 +427,55 @@ class DataLoader:
         """
         try:
             import pymysql
-            from pymysql.cursors import DictCursor
+            from pymysql.cursors import SSCursor
         except ImportError:
             raise ImportError("pymysql is required for MySQL support. Install it with: pip install pymysql")
         
-        from config import MYSQL_CONFIG, MYSQL_TABLE_NAME, FIELD_MAP, ACTIVE_FIELD_INDICES
+        from config import MYSQL_CONFIG
         
-        # Create MySQL connection
+        # Get a MySQL connection (unbuffered tuple cursor - rows are streamed, not buffered).
+        # With DBUtils installed it comes from a pool, and close() returns it there
         try:
-            connection = pymysql.connect(**MYSQL_CONFIG, cursorclass=DictCursor)
+            if PooledDB is not None:
+                connection = _mysql_pool().connection()
+            else:
+                connection = pymysql.connect(**MYSQL_CONFIG, cursorclass=SSCursor)
         except pymysql.Error as e:
             raise ConnectionError(f"Failed to connect to MySQL: {e}")
         
+        query, field_keys = _mysql_select()
+        
         try:
             with connection.cursor() as cursor:
-                # Build SELECT query with all active field indices
-                field_columns = ", ".join([f"field_{i}" for i in ACTIVE_FIELD_INDICES])
-                query = f"SELECT id, {field_columns} FROM {MYSQL_TABLE_NAME}"
-                
                 cursor.execute(query)
-                rows = cursor.fetchall()
+                
+                # Repeated strings (states, cities, vehicle types, ...) share one
+                # object across rows instead of the driver's fresh copy per cell.
+                # Only str is shared: equal values of other types (1 vs Decimal('1.00'))
+                # would otherwise collapse into whichever arrived first
+                shared_str = {}.setdefault
                 
                 # Convert field indices to logical names using FIELD_MAP
                 vendors = []
-                for row in rows:
-                    vendor = {"id": row.get("id")}
-                    
-                    # Map field_0, field_1, ... to logical names
-                    for idx in ACTIVE_FIELD_INDICES:
-                        field_key = f"field_{idx}"
-                        field_value = row.get(field_key, "")
+                rows = cursor.fetchmany(MYSQL_FETCH_SIZE)
+                while rows:
+                    for row in rows:
+                        vendor = {"id": row[0]}
                         
-                        # Get logical name from FIELD_MAP
-                        if idx in FIELD_MAP:
-                            logical_name = FIELD_MAP[idx]["name"]
-                            vendor[logical_name] = field_value if field_value else None
+                        for (logical_name, field_key), field_value in zip(field_keys, row[1:]):
+                            if not field_value:
+                                value = None
+                            elif type(field_value) is str:
+                                value = shared_str(field_value, field_value)
+                            else:
+                                value = field_value
+                            if logical_name:
+                                vendor[logical_name] = value
+                            # Also keep field index access for pure index operations
+                            vendor[field_key] = value
                         
-                        # Also keep field index access for pure index operations
-                        vendor[f"field_{idx}"] = field_value if field_value else None
-                    
-                    vendors.append(vendor)
+                        vendors.append(vendor)
+                    rows = cursor.fetchmany(MYSQL_FETCH_SIZE)
                 
                 return vendors
                 
@@ -198,7 +492,6 @@ class DataLoader:
         try:
             import psycopg2
             from psycopg2.extras import RealDictCursor
-            from datetime import datetime
         except ImportError:
             raise ImportError("psycopg2 is required for PostgreSQL support. Install it with: pip install psycopg2-binary")
         
@@ -211,75 +504,26 @@ class DataLoader:
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
         
         try:
-            with connection.cursor() as cursor:
+            # Loading only reads - let the server skip write bookkeeping for the session
+            connection.set_session(readonly=True)
+            
+            # Named (server-side) cursor: rows are streamed in POSTGRES_FETCH_SIZE
+            # batches instead of the whole table being buffered client-side
+            with connection.cursor(name="vendor_load") as cursor:
+                cursor.itersize = POSTGRES_FETCH_SIZE
+                
                 # Select all columns from the vendors table
                 query = f"SELECT * FROM {POSTGRES_TABLE_NAME}"
                 
                 cursor.execute(query)
-                rows = cursor.fetchall()
                 
                 # Convert to list of dictionaries and process notes field
                 vendors = []
-                for row in rows:
+                for row in cursor:
                     vendor = dict(row)
                     
                     # Process notes field - convert array of objects to searchable text with temporal context
-                    if 'notes' in vendor and vendor['notes']:
-                        notes_data = vendor['notes']
-                        
-                        # If notes is a list of objects with 'comment' and 'timestamp' fields
-                        if isinstance(notes_data, list):
-                            # Sort notes by timestamp (newest first) to prioritize recent comments
-                            sorted_notes = sorted(
-                                notes_data,
-                                key=lambda x: x.get('timestamp', ''),
-                                reverse=True
-                            )
-                            
-                            # Build searchable text with temporal indicators
-                            searchable_parts = []
-                            for idx, note in enumerate(sorted_notes):
-                                if isinstance(note, dict) and 'comment' in note:
-                                    comment = note['comment']
-                                    timestamp = note.get('timestamp', '')
-                                    
-                                    # Add temporal context for search
-                                    if idx == 0:
-                                        # Most recent comment - add emphasis
-                                        searchable_parts.append(f"RECENT: {comment}")
-                                    elif idx == len(sorted_notes) - 1:
-                                        # Oldest comment
-                                        searchable_parts.append(f"EARLIER: {comment}")
-                                    else:
-                                        # Middle comments
-                                        searchable_parts.append(comment)
-                                    
-                                    # Parse timestamp for additional context
-                                    try:
-                                        if timestamp:
-                                            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                                            # Add year/month context for very old/new comments
-                                            date_str = dt.strftime('%Y-%m')
-                                            searchable_parts.append(f"[{date_str}]")
-                                    except:
-                                        pass
-                            
-                            # Store original notes array (for display)
-                            vendor['notes_raw'] = notes_data
-                            
-                            # Store combined searchable text (for embeddings)
-                            vendor['notes'] = ' | '.join(searchable_parts) if searchable_parts else ''
-                            
-                            # Store count for stats
-                            vendor['notes_count'] = len(sorted_notes)
-                        else:
-                            vendor['notes'] = str(notes_data) if notes_data else ''
-                            vendor['notes_raw'] = []
-                            vendor['notes_count'] = 0
-                    else:
-                        vendor['notes'] = ''
-                        vendor['notes_raw'] = []
-                        vendor['notes_count'] = 0
+                    vendor['notes'], vendor['notes_raw'], vendor['notes_count'] = _process_notes(vendor.get('notes'))
                     
                     # Convert datetime objects to strings for JSON serialization
                     if 'created_at' in vendor and vendor['created_at']:
@@ -306,12 +550,13 @@ class DataLoader:
         """
         return df.to_dict('records')
     
-    def validate_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def validate_data(self, data: List[Dict[str, Any]], start_index: int = 0) -> List[Dict[str, Any]]:
         """
         Validate and clean vendor data
         
         Args:
             data: List of vendor dictionaries
+            start_index: Position of the first record in the full dataset (for generated IDs)
             
         Returns:
             Validated and cleaned data
@@ -320,66 +565,149 @@ class DataLoader:
         
         validated_data = []
         
-        for idx, record in enumerate(data):
-            # Ensure all required fields exist (fill with None if missing)
-            validated_record = {}
-            
-            for field in VENDOR_FIELDS:
-                validated_record[field] = record.get(field, None)
+        # One pass per record: fill missing fields with None and convert empty
+        # strings / "null" to None while copying
+        for record_id, record in enumerate(data, start_index + 1):
+            get = record.get
+            validated_record = {
+                field: None if (value := get(field)) == "" or value == "null" else value
+                for field in VENDOR_FIELDS
+            }
             
             # Keep the original ID if present
-            if 'id' in record:
-                validated_record['id'] = record['id']
-            else:
-                validated_record['id'] = idx + 1
-            
-            # Convert empty strings to None
-            for key, value in validated_record.items():
-                if value == "" or value == "null":
-                    validated_record[key] = None
+            value = record['id'] if 'id' in record else record_id
+            validated_record['id'] = None if value == "" or value == "null" else value
             
             validated_data.append(validated_record)
         
         return validated_data
     
-    def load(self, validate: bool = True) -> List[Dict[str, Any]]:
+    def iter_vendors(self, validate: bool = True, chunksize: int = 10_000) -> Iterator[Dict[str, Any]]:
         """
-        Load data from configured source (auto-detects format)
+        Stream data from configured source (auto-detects format)
+        
+        Records are read and validated chunk by chunk, so for file sources (JSON,
+        CSV, Excel) peak memory stays proportional to chunksize rather than the file size.
         
         Args:
             validate: Whether to validate the data
+            chunksize: Number of records validated at a time
             
-        Returns:
-            List of vendor dictionaries
+        Yields:
+            Vendor dictionaries
         """
         # Load based on DATA_TYPE config
         if self.data_type == 'postgresql':
-            data = self.load_from_postgresql()
             # PostgreSQL data is pre-validated with field mapping, skip legacy validation
-            print(f"✓ Loaded {len(data)} vendors from PostgreSQL source")
-            return data
+            yield from self.load_from_postgresql()
+            return
         elif self.data_type == 'mysql':
-            data = self.load_from_mysql()
             # MySQL data is pre-validated with field mapping, skip legacy validation
-            print(f"✓ Loaded {len(data)} vendors from MySQL source")
-            return data
+            yield from self.load_from_mysql()
+            return
         elif self.data_type == 'json' or self.data_source.endswith('.json'):
-            data = self.load_from_json()
-        elif self.data_type == 'csv' or self.data_source.endswith('.csv'):
-            data = self.load_from_csv()
-        elif self.data_type == 'excel' or self.data_source.endswith(('.xlsx', '.xls')):
-            data = self.load_from_excel()
+            records = self.iter_from_json()
+        elif (self.data_type in ('csv', 'excel')
+              or self.data_source.endswith(('.csv', '.xlsx', '.xls'))):
+            records = chain.from_iterable(self.iter_chunks(chunksize=chunksize))
         elif self.data_type == 'sql':
-            data = self.load_from_sql()
+            records = iter(self.load_from_sql())
         else:
             raise ValueError(f"Unsupported data type: {self.data_type} or file: {self.data_source}")
         
-        if validate:
-            data = self.validate_data(data)
+        if not validate:
+            yield from records
+            return
+        
+        offset = 0
+        chunk = list(islice(records, chunksize))
+        while chunk:
+            yield from self.validate_data(chunk, start_index=offset)
+            offset += len(chunk)
+            chunk = list(islice(records, chunksize))
+    
+    def load(self, validate: bool = True) -> List[Dict[str, Any]]:
+        """
+        Load data from configured source (auto-detects format)
         
-        print(f"✓ Loaded {len(data)} vendors from {self.data_type.upper()} source")
+        Args:
+            validate: Whether to validate the data
+            
+        Returns:
+            List of vendor dictionaries
+        """
+        # File sources: reuse the parsed records while the file is unchanged
+        # (best-effort: an unreadable or unwritable memo never fails the load)
+        cache_path = self._load_cache_path(validate)
+        data = None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    data = pickle.load(f)
+            except Exception as e:
+                # Corrupt or outdated pickles can fail in many ways (ValueError,
+                # AttributeError, ImportError, ...) - the memo is only an optimization
+                print(f"⚠️  Ignoring unreadable data cache {cache_path}: {e}")
+        
+        if data is None:
+            data = list(self.iter_vendors(validate=validate))
+            if cache_path:
+                try:
+                    self._write_load_cache(cache_path, data)
+                except (OSError, pickle.PicklingError) as e:
+                    print(f"⚠️  Could not write data cache {cache_path}: {e}")
+        
+        source_names = {'postgresql': 'PostgreSQL', 'mysql': 'MySQL'}
+        print(f"✓ Loaded {len(data)} vendors from {source_names.get(self.data_type, self.data_type.upper())} source")
         return data
     
+    def _load_cache_path(self, validate: bool) -> Optional[str]:
+        """
+        Get the on-disk memo path for the current file source
+        
+        The name is keyed on the file's path, mtime and size (plus the validation
+        settings and loader format version), so any change to the file yields a new key.
+        
+        Args:
+            validate: Whether the cached records are validated
+            
+        Returns:
+            Memo file path, or None for database sources
+        """
+        if self.data_type in ('postgresql', 'mysql', 'sql') or not os.path.isfile(self.data_source):
+            return None
+        
+        from config import VENDOR_FIELDS
+        
+        path = os.path.abspath(self.data_source)
+        stat = os.stat(path)
+        key = repr((LOAD_CACHE_VERSION, path, stat.st_mtime_ns, stat.st_size,
+                    validate, list(VENDOR_FIELDS)))
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(os.path.dirname(path), '.cache', f"{os.path.basename(path)}.{digest}.pkl")
+    
+    def _write_load_cache(self, cache_path: str, data: List[Dict[str, Any]]):
+        """
+        Write the load memo and remove stale memos of the same source file
+        
+        Args:
+            cache_path: Memo file path from _load_cache_path
+            data: Loaded vendor records
+        """
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # Only memos of this exact file (<basename>.<sha1>.pkl) - not e.g. vendors.json.bak
+        stale_memo = re.compile(re.escape(os.path.basename(self.data_source)) + r"\.[0-9a-f]{40}\.pkl")
+        for name in os.listdir(cache_dir):
+            if stale_memo.fullmatch(name):
+                os.remove(os.path.join(cache_dir, name))
+        
+        # Write to a temp file first so a concurrent reader never sees a partial memo
+        with open(f"{cache_path}.tmp", 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{cache_path}.tmp", cache_path)
+    
     def get_sample_data(self, n: int = 5) -> List[Dict[str, Any]]:
         """
         Get a sample of vendor data
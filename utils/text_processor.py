@@ -3,7 +3,156 @@ Text Processor Module
 Handles text preprocessing and conversion of vendor records to searchable text
 """
 
-from typing import Dict, Any, List, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+# Optional: single-pass multi-keyword matching (Aho-Corasick automaton)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Field configuration is bound once at import instead of on every call
+from config import (
+    FIELD_MAP, 
+    SEMANTIC_SEARCH_FIELDS, 
+    FIELD_INDEX_WEIGHTS,
+    SPECIALIZATION_KEYWORDS,
+    KEYWORD_REPETITION_COUNT,
+    CARD_DISPLAY_INDICES,
+    EMBEDDING_TEXT_CACHE_SIZE
+)
+
+# Placeholder values treated as empty (compared lowercased)
+_EMPTY = frozenset(('', 'none', 'null'))
+_EMPTY_MAX_LEN = max(map(len, _EMPTY))
+
+# Per-field embedding plan, invariant across vendors:
+# (logical name, field_X key, "label: " prefix, weight, collect for keyword detection)
+# High-weight fields (notes, description, services, etc. - weight >= 10) feed keyword
+# detection; with no SPECIALIZATION_KEYWORDS configured none are collected
+_HAS_KEYWORDS = bool(SPECIALIZATION_KEYWORDS)
+_FIELD_PLAN = tuple(
+    (
+        FIELD_MAP[field_idx]["name"],
+        f"field_{field_idx}",
+        sys.intern(FIELD_MAP[field_idx]["label"] + ": "),
+        FIELD_INDEX_WEIGHTS.get(field_idx, 1),
+        _HAS_KEYWORDS and FIELD_INDEX_WEIGHTS.get(field_idx, 1) >= 10,
+    )
+    for field_idx in SEMANTIC_SEARCH_FIELDS
+    if field_idx in FIELD_MAP
+)
+
+# Per-field display plan: (logical name, field_X key, "icon label: " prefix)
+_DISPLAY_PLAN = tuple(
+    (
+        FIELD_MAP[field_idx]["name"],
+        f"field_{field_idx}",
+        sys.intern(f"{FIELD_MAP[field_idx].get('icon', '')} {FIELD_MAP[field_idx]['label']}: "),
+    )
+    for field_idx in CARD_DISPLAY_INDICES
+    if field_idx in FIELD_MAP
+)
+
+
+# Specialization keywords (lowercased) and their boost text, in config order.
+# A boost is the keyword's synonyms repeated KEYWORD_REPETITION_COUNT times, each
+# followed by ". " - built once here and shared by every vendor that matches
+_KEYWORDS_LOWER = tuple(keyword.lower() for keyword in SPECIALIZATION_KEYWORDS)
+_KEYWORD_BOOSTS = tuple(
+    sys.intern("".join(f"{synonym}. " for synonym in synonyms) * KEYWORD_REPETITION_COUNT)
+    for synonyms in SPECIALIZATION_KEYWORDS.values()
+)
+
+
+def _build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over the lowercased specialization keywords
+    
+    Returns:
+        Automaton reporting every keyword occurrence (overlapping ones included),
+        or None if pyahocorasick is not installed or there are no keywords
+    """
+    if ahocorasick is None or not _KEYWORDS_LOWER:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORDS_LOWER:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _find_keyword_hits(text: str) -> List[int]:
+    """
+    Find which specialization keywords occur in a lowercased text
+    
+    Args:
+        text: Lowercased text to scan
+        
+    Returns:
+        Ascending indices into _KEYWORDS_LOWER / _KEYWORD_BOOSTS
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        # One scan finds every keyword occurrence
+        found = {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text)}
+        return [i for i, keyword in enumerate(_KEYWORDS_LOWER) if keyword in found]
+    
+    return [i for i, keyword in enumerate(_KEYWORDS_LOWER) if keyword in text]
+
+
+@lru_cache(maxsize=EMBEDDING_TEXT_CACHE_SIZE)
+def _prepare_from_values(values: Tuple[Optional[str], ...]) -> str:
+    """
+    Build the weighted embedding text from normalized field values
+    
+    Args:
+        values: One value per _FIELD_PLAN entry (None for empty fields)
+        
+    Returns:
+        Weighted text ready for embedding
+    """
+    parts = []  # Each part already ends with the ". " separator
+    spec_parts = []  # Collect text for keyword detection
+    
+    # Process each field configured for semantic search
+    for (_, _, label_prefix, weight, is_high_weight), value in zip(_FIELD_PLAN, values):
+        if value is None:
+            continue
+        
+        # Collect high-weight fields for keyword detection
+        if is_high_weight:
+            spec_parts.append(value)
+        
+        # Collapse whitespace now so the assembled text needs no clean_text pass
+        # (a trailing space is kept - clean_text would leave it before the ". ")
+        collapsed = " ".join(value.split())
+        if collapsed and value[-1].isspace():
+            collapsed += " "
+        
+        # Format text with label for better semantic understanding, then repeat
+        # it based on its weight (one string per field, not one per repeat)
+        parts.append((label_prefix + collapsed + ". ") * weight)
+    
+    # Step 2: Detect and boost specialization keywords
+    # This is crucial for matching queries like "electronics transport in Mumbai"
+    if spec_parts:
+        specialization_text = " ".join(spec_parts).lower()
+        
+        # Boosts are added in config order
+        for i in _find_keyword_hits(specialization_text):
+            # Add the keyword and all its synonyms, repeated for emphasis
+            parts.append(_KEYWORD_BOOSTS[i])
+    
+    # Join all parts and drop the final period separator. Labels and synonyms come
+    # from config and values were collapsed above, so only the end needs trimming
+    return "".join(parts)[:-2].rstrip()
 
 
 class TextProcessor:
@@ -20,13 +169,15 @@ class TextProcessor:
         Returns:
             Cleaned text
         """
-        # Remove extra whitespace
+        # Remove extra whitespace (also strips both ends). split/join is kept over a
+        # precompiled re.sub(r"\s+", " ") - it measured 4-5x faster from short
+        # values up to 30 KB weighted texts, and collapses the same characters
         text = " ".join(text.split())
         
         # Remove special characters (keep basic punctuation)
         # text = re.sub(r'[^\w\s\-,.|()]', '', text)
         
-        return text.strip()
+        return text
     
     @staticmethod
     def prepare_for_embedding(vendor: Dict[str, Any]) -> str:
@@ -46,82 +197,66 @@ class TextProcessor:
         Returns:
             Weighted text ready for embedding
         """
-        try:
-            from config import (
-                FIELD_MAP, 
-                SEMANTIC_SEARCH_FIELDS, 
-                FIELD_INDEX_WEIGHTS,
-                SPECIALIZATION_KEYWORDS,
-                KEYWORD_REPETITION_COUNT
-            )
+        # Normalized value per planned field (None = empty) - also the memo key,
+        # so vendors whose searchable fields are unchanged skip the text build
+        values = []
+        for field_name, field_key, _, _, _ in _FIELD_PLAN:
+            # Get value from vendor (try both logical name and field_X format)
+            value = vendor.get(field_name) or vendor.get(field_key)
             
-            parts = []
-            specialization_text = ""  # Collect text for keyword detection
+            # Skip empty values (only short strings can be placeholders - skip lower() otherwise)
+            if not value:
+                values.append(None)
+                continue
             
-            # Process each field configured for semantic search
-            for field_idx in SEMANTIC_SEARCH_FIELDS:
-                if field_idx not in FIELD_MAP:
-                    continue
-                
-                field_config = FIELD_MAP[field_idx]
-                field_name = field_config["name"]
-                label = field_config["label"]
-                
-                # Get value from vendor (try both logical name and field_X format)
-                value = vendor.get(field_name)
-                if value is None:
-                    value = vendor.get(f"field_{field_idx}")
-                
-                # Skip empty values
-                if not value or str(value).lower() in ['none', 'null', '']:
-                    continue
-                
+            if not isinstance(value, str):
                 value = str(value)
-                
-                # Collect high-weight fields for keyword detection
-                # (notes, description, services, etc. - fields with weight >= 10)
-                weight = FIELD_INDEX_WEIGHTS.get(field_idx, 1)
-                if weight >= 10:
-                    specialization_text += " " + value.lower()
-                
-                # Format text with label for better semantic understanding
-                formatted_text = f"{label}: {value}"
-                
-                # Repeat the text based on its weight
-                parts.extend([formatted_text] * weight)
-            
-            # Step 2: Detect and boost specialization keywords
-            # This is crucial for matching queries like "electronics transport in Mumbai"
-            if specialization_text and SPECIALIZATION_KEYWORDS:
-                for keyword, synonyms in SPECIALIZATION_KEYWORDS.items():
-                    if keyword.lower() in specialization_text:
-                        # Add the keyword and all its synonyms, repeated for emphasis
-                        parts.extend(synonyms * KEYWORD_REPETITION_COUNT)
-            
-            # Join all parts with period separator
-            text = ". ".join(parts)
+            if len(value) <= _EMPTY_MAX_LEN and value.lower() in _EMPTY:
+                values.append(None)
+                continue
             
-            # Clean up the text
-            text = TextProcessor.clean_text(text)
-            
-            return text
-            
-        except ImportError:
-            # Should not happen - config is always available
-            return ""
+            values.append(value)
+        
+        return _prepare_from_values(tuple(values))
     
     @staticmethod
-    def batch_prepare(vendors: List[Dict[str, Any]]) -> List[str]:
+    def batch_prepare(vendors: List[Dict[str, Any]], workers: int = 1) -> List[str]:
         """
         Prepare multiple vendors for embedding
         
         Args:
             vendors: List of vendor dictionaries
+            workers: Number of worker processes (1 = prepare in this process)
             
         Returns:
             List of prepared texts
         """
-        return [TextProcessor.prepare_for_embedding(v) for v in vendors]
+        if workers <= 1:
+            return list(TextProcessor.iter_prepare(vendors))
+        
+        # Vendors are independent - split them across processes in chunks
+        # (about 4 per worker, to balance uneven vendor sizes)
+        vendors = list(vendors)
+        chunksize = max(1, len(vendors) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(TextProcessor.prepare_for_embedding, vendors, chunksize=chunksize))
+    
+    @staticmethod
+    def iter_prepare(vendors: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Lazily prepare vendors for embedding, one text at a time
+        
+        Lets callers embed in mini-batches (e.g. via itertools.islice) without
+        holding every prepared text in memory at once.
+        
+        Args:
+            vendors: Iterable of vendor dictionaries
+            
+        Returns:
+            Iterator of prepared texts, in input order
+        """
+        # map() drives the loop in C and resolves the method only once
+        return map(TextProcessor.prepare_for_embedding, vendors)
     
     @staticmethod
     def format_for_display(vendor: Dict[str, Any]) -> str:
@@ -134,31 +269,20 @@ class TextProcessor:
         Returns:
             Formatted display text
         """
-        try:
-            from config import FIELD_MAP, CARD_DISPLAY_INDICES
-            
-            lines = []
-            
-            for field_idx in CARD_DISPLAY_INDICES:
-                if field_idx not in FIELD_MAP:
-                    continue
-                
-                field_config = FIELD_MAP[field_idx]
-                field_name = field_config["name"]
-                label = field_config["label"]
-                icon = field_config.get("icon", "")
-                
-                # Get value from vendor
-                value = vendor.get(field_name) or vendor.get(f"field_{field_idx}")
-                
-                if value and str(value).lower() not in ['none', 'null', '']:
-                    lines.append(f"{icon} {label}: {value}")
+        lines = []
+        
+        for field_name, field_key, prefix in _DISPLAY_PLAN:
+            # Get value from vendor
+            value = vendor.get(field_name) or vendor.get(field_key)
             
-            return "\n".join(lines) if lines else "No data available"
+            if not value:
+                continue
             
-        except ImportError:
-            # Fallback to legacy method
-            return TextProcessor.format_for_display_legacy(vendor)
+            text = value if isinstance(value, str) else str(value)
+            if len(text) > _EMPTY_MAX_LEN or text.lower() not in _EMPTY:
+                lines.append(prefix + text)
+        
+        return "\n".join(lines) if lines else "No data available"
     
     @staticmethod
     def format_for_display_legacy(vendor: Dict[str, Any]) -> str: